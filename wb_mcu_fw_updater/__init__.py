@@ -29,6 +29,7 @@ CONFIG = {
     "MAX_DB_RECORDS": 100,
     "DB_FILE_LOCATION": "/var/lib/wb-mcu-fw-updater/devices.jsondb",
     "RELEASES_FNAME": "/usr/lib/wb-release",
+    "RELEASES_CACHE_DIR": "/var/cache/wb-mcu-fw-updater/",
     # fw-releases.wirenboard.com endpoints
     "ROOT_URL": "http://fw-releases.wirenboard.com/",
     "FW_SIGNATURES_FILE_URI": "fw/by-signature/fw_signatures.txt",
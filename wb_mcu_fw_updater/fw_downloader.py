@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 
 import errno
+import hashlib
+import json
 import os
 import socket
 import sys
@@ -25,25 +27,36 @@ class RemoteFileDownloadingError(WBRemoteStorageError):
     pass
 
 
-def get_request(url_path, tries=3):  # maybe move to config?
+class RemoteFileNotModified(WBRemoteStorageError):
+    pass
+
+
+def get_request(url_path, tries=3, headers=None):  # maybe move to config?
     """
     Sending GET request to url; returning responce's content.
 
     :param url_path: url, request will be sent to
     :type url_path: str
+    :param headers: additional request headers (e.g. for a conditional request), defaults to None
+    :type headers: dict, optional
     :return: responce's content
     :rtype: bytestring
     """
     logger.debug("GET: %s", url_path)
+    request = urllib.request.Request(url_path, headers=headers or {})
     for _ in range(tries):
         try:
-            return urllib.request.urlopen(url_path, timeout=1.5)
-        except (urllib.error.URLError, urllib.error.HTTPError, socket.error):
+            return urllib.request.urlopen(request, timeout=1.5)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                raise RemoteFileNotModified(url_path) from e
+            continue
+        except (urllib.error.URLError, socket.error):
             continue
     raise WBRemoteStorageError(url_path)
 
 
-@lru_cache(maxsize=10)
+@lru_cache(maxsize=256)  # latest fw/bl version files of every device model on bus
 def read_remote_file(url_path, coding="utf-8"):
     ret = ""
     try:
@@ -56,10 +69,64 @@ def read_remote_file(url_path, coding="utf-8"):
     raise RemoteFileReadingError(f"{url_path} is empty!")
 
 
+def _load_cached_remote_file(cache_fpath):
+    try:
+        with open(cache_fpath, "r", encoding="utf-8") as fp:
+            return json.load(fp)
+    except (IOError, ValueError):
+        return {}
+
+
+def _save_cached_remote_file(cache_fpath, cached):
+    try:
+        os.makedirs(os.path.dirname(cache_fpath), exist_ok=True)
+        tmp_fpath = f"{cache_fpath}.tmp"
+        with open(tmp_fpath, "w", encoding="utf-8") as fp:
+            json.dump(cached, fp)
+        os.replace(tmp_fpath, cache_fpath)
+    except (IOError, ValueError):
+        logger.debug("Could not save %s", cache_fpath, exc_info=True)
+
+
+@lru_cache(maxsize=10)
 def get_remote_releases_info(
-    remote_fname=urllib.parse.urljoin(CONFIG["ROOT_URL"], CONFIG["FW_RELEASES_FILE_URI"])
+    remote_fname=urllib.parse.urljoin(CONFIG["ROOT_URL"], CONFIG["FW_RELEASES_FILE_URI"]),
+    cache_dir=CONFIG["RELEASES_CACHE_DIR"],
 ):
-    return read_remote_file(remote_fname)
+    """
+    Release-versions file changes rarely => it's contents are stored on disk with http validators
+    (ETag, Last-Modified) and are downloaded again only if server reports a change.
+    """
+    cache_fpath = os.path.join(cache_dir, f"{hashlib.sha256(remote_fname.encode('utf-8')).hexdigest()}.json")
+    cached = _load_cached_remote_file(cache_fpath)
+    headers = {}
+    if cached.get("contents"):
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    ret = ""
+    try:
+        response = get_request(remote_fname, headers=headers)
+        ret = str(response.read().decode("utf-8")).strip()
+    except RemoteFileNotModified:
+        logger.debug("%s is not modified; using cached contents", remote_fname)
+        return cached["contents"]
+    except Exception as e:  # pylint:disable=broad-exception-caught
+        six.raise_from(RemoteFileReadingError, e)
+    if not ret:
+        raise RemoteFileReadingError(f"{remote_fname} is empty!")
+
+    _save_cached_remote_file(
+        cache_fpath,
+        {
+            "etag": response.info().get("ETag"),
+            "last_modified": response.info().get("Last-Modified"),
+            "contents": ret,
+        },
+    )
+    return ret
 
 
 def get_fw_signatures_list():
@@ -36,12 +36,14 @@ class FixedLengthList(list):
 
 class JsonDB:
     """
-    Storing information about device's fw_signature.
+    Storing information about device's fw_signature (and latest probe results).
     """
 
     _SLAVEID = "slaveid"
     _PORT = "port"
     _FW_SIGNATURE = "fw_signature"
+    _STATE = "state"
+    _PROBE_EPOCH = "probe_epoch"
 
     def __init__(self, db_fname):
         self.db_fname = os.path.expanduser(db_fname)
@@ -55,6 +57,8 @@ class JsonDB:
         else:
             logger.debug("File %s not found! Initiallizing empty db", db_fname)
             self.container = FixedLengthList()
+        # monotonic number of the current run; is greater, than any stored one
+        self.probe_epoch = max((device.get(self._PROBE_EPOCH, 0) for device in self.container), default=0) + 1
 
     def dump(self):
         try:
@@ -70,14 +74,40 @@ class JsonDB:
                 return index
         return None
 
-    def save(self, slaveid, port, fw_signature):
+    def save(self, slaveid, port, fw_signature, state=None):
         existing_device_index = self._find(slaveid, port, sequence=self.container)
         if existing_device_index is not None:  # Could be zero
             removed_device = self.container.pop(existing_device_index)
             logger.debug("Removing device: %s", str(removed_device))
         device = {self._SLAVEID: slaveid, self._PORT: port, self._FW_SIGNATURE: fw_signature}
+        if state is not None:
+            device.update({self._STATE: state, self._PROBE_EPOCH: self.probe_epoch})
         self.container.append(device)
 
+    def get_probe_result(self, slaveid, port):
+        """
+        Returns (fw_signature, state) of a device, stored by previous probe (or None).
+        Results of earlier probes are outdated: device was not found alive by previous probe.
+        """
+        sequence = self.container[::-1]
+        found_index = self._find(slaveid, port, sequence)
+        if found_index is None or self._STATE not in sequence[found_index]:
+            return None
+        device = sequence[found_index]
+        if device.get(self._PROBE_EPOCH, 0) < self.probe_epoch - 1:
+            return None
+        return device[self._FW_SIGNATURE], device[self._STATE]
+
+    def forget_probe_result(self, slaveid, port):
+        """
+        Keeping only fw_signature of a device (it is needed to restore device from bootloader).
+        """
+        found_index = self._find(slaveid, port, self.container)
+        if found_index is not None:
+            device = self.container[found_index]
+            for key in (self._STATE, self._PROBE_EPOCH):
+                device.pop(key, None)
+
     def get_fw_signature(self, slaveid, port):
         """
         Searching in a reversed shadow-copy of container.
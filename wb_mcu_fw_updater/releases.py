@@ -3,10 +3,15 @@
 
 import re
 from collections import defaultdict
+from functools import lru_cache
 from posixpath import join as urljoin  # py2/3 compatibility
 
+import yaml
+
 from . import CONFIG, logger
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml-based loader is much faster
+
 
 class VersionParsingError(Exception):
     pass
@@ -49,6 +54,37 @@ def get_release_file_urls(
     return ret
 
 
+@lru_cache(maxsize=4)
+def parse_remote_releases(contents):
+    """
+    Parsing contents of remote release-versions file (is called per each device => parsed once per contents).
+    Unchanged file is not downloaded again (see fw_downloader.get_remote_releases_info).
+
+    :param contents: contents of remote releases file
+    :type contents: str
+    :return: parsed releases file
+    :rtype: dict
+    """
+    return yaml.load(contents, Loader=YAML_LOADER) or {}
+
+
+@lru_cache(maxsize=4)
+def get_released_endpoints(contents):
+    """
+    Flat lookup of fw endpoints, stored in remote release-versions file.
+
+    :param contents: contents of remote releases file
+    :type contents: str
+    :return: {(fw_signature, suite): fw_endpoint}
+    :rtype: dict
+    """
+    return {
+        (fw_signature, suite): fw_endpoint
+        for fw_signature, endpoints in (parse_remote_releases(contents).get("releases") or {}).items()
+        for suite, fw_endpoint in (endpoints or {}).items()
+    }
+
+
 def parse_fw_version(endpoint_url):
     """
     Parsing fw version from endpoint url, stored in releases file
@@ -1,25 +1,40 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import array
 import enum
+import fcntl
 import json
 import logging
 import os
-import subprocess
+import signal
 import sys
 import termios
 import threading
 import time
 import urllib.parse
 from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from copy import deepcopy
+from functools import cached_property, lru_cache
 from io import open
 
 import semantic_version
 import six
 import tqdm
-import yaml
+
+try:
+    import orjson as json_parser  # several times faster on big wb-mqtt-serial configs
+except ImportError:
+    try:
+        import ujson as json_parser
+    except ImportError:
+        json_parser = json
+
+try:
+    import ijson  # decodes ports of wb-mqtt-serial config one by one
+except ImportError:
+    ijson = None
 
 # rework params setting to get rid of imports-order-magic
 # isort: off
@@ -46,9 +61,11 @@ from . import (  # pylint:disable=wrong-import-position
 # isort: on
 
 db = jsondb.JsonDB(CONFIG["DB_FILE_LOCATION"])
+_db_lock = threading.Lock()  # ports are probed concurrently
 
 
 RELEASE_INFO = None
+RELEASE_URLS = ()  # remote release-versions files for RELEASE_INFO; filled once with it
 
 
 class UpdateDeviceError(Exception):
@@ -96,7 +113,7 @@ def spinner(
     pbar_update_thread = threading.Thread(target=pbar_update_runner, args=(pbar, tdelta_s, stop_event))
     pbar_update_thread.start()
     try:
-        yield
+        yield pbar
     finally:
         stop_event.set()
         pbar_update_thread.join()
@@ -127,16 +144,39 @@ def fill_release_info():
     wb-mcu-fw-updater supposed to be launched only on devices, supporting wb-releases
     incorrect wb-releases file indicates strange erroneous behavior
     """
-    global RELEASE_INFO  # pylint:disable=global-statement
+    global RELEASE_INFO, RELEASE_URLS  # pylint:disable=global-statement
     releases_fname = CONFIG["RELEASES_FNAME"]
     try:
         RELEASE_INFO = releases.parse_releases(releases_fname)
+        RELEASE_URLS = tuple(releases.get_release_file_urls(RELEASE_INFO))
     except Exception:  # pylint:disable=broad-exception-caught
         logger.error("Critical error in %s file! Contact the support!", releases_fname)
         six.reraise(*sys.exc_info())
 
 
-def get_released_fw(fw_signature, release_info):
+def _try_get_remote_releases_info(url):
+    try:
+        return fw_downloader.get_remote_releases_info(url)
+    except fw_downloader.WBRemoteStorageError as e:
+        return e  # will be reported by lookup in get_released_fw
+
+
+@lru_cache(maxsize=2)
+def fetch_remote_releases_infos(urls):
+    """
+    Fetching all release-versions files concurrently => waiting for max of urls latencies instead of sum.
+    Failures are stored too: each url is requested (with all retries) once per run.
+
+    :return: {url: contents or raised fw_downloader.WBRemoteStorageError}
+    :rtype: dict
+    """
+    if len(urls) > 1:
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return dict(zip(urls, executor.map(_try_get_remote_releases_info, urls)))
+    return {url: _try_get_remote_releases_info(url) for url in urls}
+
+
+def get_released_fw(fw_signature, release_info, release_urls=None):
     """
     Looking for released-fw:
         version
@@ -144,13 +184,19 @@ def get_released_fw(fw_signature, release_info):
     By:
         fw_signature
         release suite
+
+    release_urls (built from release_info, if not passed) could be precomputed by caller.
     """
     suite = release_info["SUITE"]
-    for url in releases.get_release_file_urls(release_info):  # repo-prefix is the first, if exists
+    urls = tuple(release_urls or releases.get_release_file_urls(release_info))
+    fetched_contents = fetch_remote_releases_infos(urls)
+    for url in urls:  # repo-prefix is the first, if exists
         logger.debug("Looking to %s (suite: %s)", url, str(suite))
         try:
-            contents = fw_downloader.get_remote_releases_info(url)
-            fw_endpoint = yaml.safe_load(contents).get("releases", {}).get(fw_signature, {}).get(suite)
+            contents = fetched_contents[url]
+            if isinstance(contents, Exception):
+                raise contents.with_traceback(None)  # stored error is re-raised for each device
+            fw_endpoint = releases.get_released_endpoints(contents).get((fw_signature, suite))
             if fw_endpoint:
                 fw_version = releases.parse_fw_version(fw_endpoint)
                 logger.debug(
@@ -244,7 +290,7 @@ def find_bootloader_connection_params(
         except bindings.UARTSettingsNotFoundError as e:
             six.raise_from(minimalmodbus.NoResponseError, e)
 
-    initial_uart_settings = deepcopy(modbus_connection.settings)
+    initial_uart_settings = modbus_connection.settings  # immutable namedtuple
     modbus_connection._set_port_settings_raw(uart_settings)  # pylint: disable=protected-access
     try:
         modbus_connection.get_slave_addr()
@@ -258,45 +304,47 @@ def find_bootloader_connection_params(
     raise minimalmodbus.NoResponseError()
 
 
+def _get_fw_info(modbus_connection):
+    """
+    Values are usually cached by connection, since check_device_is_a_wb_one has read them.
+
+    :raises bindings.TooOldDeviceError: device is too old to have fw_signature
+    :return: fw_signature, fw_version
+    :rtype: tuple
+    """
+    return modbus_connection.get_fw_signature(), modbus_connection.get_fw_version()
+
+
 def check_device_is_a_wb_one(modbus_connection):
     """
     Foreign devices recognition:
-        1) performing any wb-specific modbus call (get_sn for example). Could raise:
+        reading a block of wb-specific regs (device_signature, fw_version, sn, fw_signature, uptime)
+        per as few modbus calls, as possible. Could raise:
             minimalmodbus.SlaveReportedException() if foreign device;
             minimalmodbus.NoResponseError() if disconnected;
             ValueError() if minimalmodbus's slaveid check failed => device is foreign
-        2) performing get_fw_signature() call. If 1) succeed, could raise:
-            minimalmodbus.IllegalRequestError() (inside!!; reraises TooOldDeviceError())
-                if device is a wb-one, but too old for any updates
-        3) performing a set of additional wb-specific calls:
-            get_device_signature(), get_fw_version(), get_uptime().
-            If 1), 2) are succeed, any modbus error here means, device is foreign
+        If the first call succeed, any modbus error in the following ones (bindings.PartialResponseError)
+        means, device is foreign (WB devices assume to have all these regs).
+        Too old wb devices (without fw_signature) are not foreign ones.
     """
     try:
-        sn = modbus_connection.get_serial_number()  # Will raise NoResponseError, if disconnected
-        fw_sig = modbus_connection.get_fw_signature()
-    except bindings.TooOldDeviceError:
-        fw_sig = ""
+        metadata = modbus_connection.read_metadata_block()  # Will raise NoResponseError, if disconnected
     except (
         ValueError,
         minimalmodbus.SlaveReportedException,
+        bindings.PartialResponseError,
     ) as e:  # minimalmodbus's slaveid check performs at _exec_command stage
         six.raise_from(ForeignDeviceError, e)
 
-    try:  # WB devices assume to have all these regs
-        logger.debug("%s %d:", modbus_connection.port, modbus_connection.slaveid)
-        logger.debug(
-            "\t%s %d %s %s %d",
-            modbus_connection.get_device_signature(),
-            sn,
-            fw_sig,
-            modbus_connection.get_fw_version(),
-            modbus_connection.get_uptime(),
-        )
-    except minimalmodbus.ModbusException as e:
-        raise ForeignDeviceError(
-            f"Possibly, device ({modbus_connection.port} {modbus_connection.slaveid}) is not a WB-one!"
-        ) from e
+    logger.debug("%s %d:", modbus_connection.port, modbus_connection.slaveid)
+    logger.debug(
+        "\t%s %d %s %s %d",
+        metadata.device_signature,
+        metadata.serial_number,
+        metadata.fw_signature,
+        metadata.fw_version,
+        metadata.uptime,
+    )
 
 
 def get_correct_modbus_connection(
@@ -326,16 +374,35 @@ def get_correct_modbus_connection(
     return modbus_connection
 
 
-def get_ports_on_driver(driver_config_fname):
-    ports = []
+def load_driver_config(driver_config_fname):
     try:
-        with open(driver_config_fname, "r", encoding="utf-8") as file:
-            config_dict = json.load(file)
+        with open(driver_config_fname, "rb") as file:
+            return json_parser.loads(file.read())
     except (ValueError, IOError) as e:
         logger.exception("Error in %s", driver_config_fname)
         raise ConfigParsingError from e
 
-    for port in config_dict.get("ports", []):
+
+def iter_driver_config_ports(driver_config_fname):
+    """
+    Yielding ports of driver's config one by one.
+    Streaming parser (if available with C backend) does not materialize the whole config.
+    """
+    if (ijson is None) or (ijson.backend != "yajl2_c"):  # pure-python ijson is slower, than a full parse
+        yield from load_driver_config(driver_config_fname).get("ports", [])
+        return
+    try:
+        with open(driver_config_fname, "rb") as file:
+            yield from ijson.items(file, "ports.item")
+    except (ijson.JSONError, IOError) as e:
+        logger.exception("Error in %s", driver_config_fname)
+        raise ConfigParsingError from e
+
+
+def get_ports_on_driver(driver_config_fname):
+    ports = []
+
+    for port in iter_driver_config_ports(driver_config_fname):
         if port.get("enabled", False) and port.get("path", False):
             ports.append(port["path"])
     return ports
@@ -350,21 +417,14 @@ def get_devices_on_driver(driver_config_fname):
     """
     found_devices = {}
 
-    try:
-        with open(driver_config_fname, "r", encoding="utf-8") as file:
-            config_dict = json.load(file)
-    except (ValueError, IOError) as e:
-        logger.exception("Error in %s", driver_config_fname)
-        six.raise_from(ConfigParsingError, e)
-
-    for port in config_dict.get("ports", []):
+    for port in iter_driver_config_ports(driver_config_fname):
         if port.get("enabled", False) and port.get(
             "path", False
         ):  # updating devices only on active RS-485 ports
             port_name = port["path"]
             uart_params_of_port = [int(port["baud_rate"]), port["parity"], int(port["stop_bits"])]
             port_response_timeout = int(port.get("response_timeout_ms", 0)) * 1e-3
-            devices_on_port = set()
+            devices_on_port = {}  # ordered deduplication; keeps config's order of devices
             for serial_device in port.get("devices", []):
                 if not serial_device.get("enabled", True):
                     continue
@@ -384,7 +444,7 @@ def get_devices_on_driver(driver_config_fname):
                         port_name,
                     )
                     continue
-                devices_on_port.add((device_name, parsed_slaveid, device_response_timeout))
+                devices_on_port[(device_name, parsed_slaveid, device_response_timeout)] = None
             if devices_on_port:
                 found_devices.update(
                     {
@@ -462,6 +522,15 @@ def direct_flash(  # pylint:disable=too-many-arguments
     if do_check_userdata_saving and (not flasher.is_userdata_preserved(parsed_wbfw)):
         _ensure("User data (such as ir commands) will be erased. Are you sure? (do a backup if not!)")
     flasher.flash_in_bl(parsed_wbfw)
+    device.clear_metadata_cache()
+
+
+@lru_cache(maxsize=1024)
+def parse_version(version):
+    """
+    Devices of the same model usually share versions => parsed versions are cached.
+    """
+    return semantic_version.Version(version)
 
 
 def is_reflash_necessary(
@@ -471,9 +540,7 @@ def is_reflash_necessary(
     if "%" in provided_version:
         provided_version = urllib.parse.unquote(provided_version)
     # end of hack
-    actual_version, provided_version = semantic_version.Version(actual_version), semantic_version.Version(
-        provided_version
-    )
+    actual_version, provided_version = parse_version(actual_version), parse_version(provided_version)
     _do_flash = False
     _skip_reason = None
 
@@ -536,7 +603,7 @@ def is_bootloader_latest(mb_connection):
     fw_sig = mb_connection.get_fw_signature()
     local_version = mb_connection.get_bootloader_version()
     remote_version = fw_downloader.RemoteFileWatcher(mode=MODE_BOOTLOADER).get_latest_version_number(fw_sig)
-    return semantic_version.Version(local_version) == semantic_version.Version(remote_version)
+    return parse_version(local_version) == parse_version(remote_version)
 
 
 def _do_download(fw_sig, version, branch, mode, retrieve_latest_vnum=True):
@@ -571,7 +638,7 @@ def _do_download(fw_sig, version, branch, mode, retrieve_latest_vnum=True):
             # instead of "retrieve_latest_vnum" logic?
 
     if version == "release":  # triggered updating from releases
-        version, released_fw_endpoint = get_released_fw(fw_sig, RELEASE_INFO)
+        version, released_fw_endpoint = get_released_fw(fw_sig, RELEASE_INFO, RELEASE_URLS)
         downloaded_fw = fw_downloader.download_remote_file(
             six.moves.urllib.parse.urljoin(CONFIG["ROOT_URL"], released_fw_endpoint)
         )
@@ -596,7 +663,7 @@ def is_bl_update_required(modbus_connection, force=False):
     remote_file_watcher = fw_downloader.RemoteFileWatcher(mode=MODE_BOOTLOADER)
     latest_remote_version = remote_file_watcher.get_latest_version_number(fw_sig)
 
-    if semantic_version.Version(local_version) == semantic_version.Version(latest_remote_version):
+    if parse_version(local_version) == parse_version(latest_remote_version):
         return False
 
     if not remote_file_watcher.is_version_exist(fw_sig, local_version):
@@ -619,8 +686,7 @@ def is_bl_update_required(modbus_connection, force=False):
     return False
 
 
-def _do_flash(modbus_connection, downloaded_wbfw: DownloadedWBFW, erase_settings, force=False):
-    fw_signature = modbus_connection.get_fw_signature()
+def _do_flash(modbus_connection, downloaded_wbfw: DownloadedWBFW, erase_settings, fw_signature, force=False):
     device_str = f"{fw_signature} {modbus_connection.port}:{modbus_connection.slaveid}"
     logger.debug("Flashing approved for %s", device_str)
     bl_to_flash = None
@@ -629,14 +695,12 @@ def _do_flash(modbus_connection, downloaded_wbfw: DownloadedWBFW, erase_settings
         if is_bl_update_required(modbus_connection, force):
             bl_to_flash = fw_downloader.RemoteFileWatcher(MODE_BOOTLOADER).download(fw_signature, "latest")
     elif downloaded_wbfw.mode == MODE_BOOTLOADER:
-        if semantic_version.Version(downloaded_wbfw.version) < semantic_version.Version(actual_bl_version):
+        if parse_version(downloaded_wbfw.version) < parse_version(actual_bl_version):
             raise UpdateDeviceError(
                 f"Bootloader downgrade (v{actual_bl_version} -> v{downloaded_wbfw.version}) is not allowed!"
             )
 
-    do_check_userdata_saving = semantic_version.Version(actual_bl_version) >= semantic_version.Version(
-        "1.2.0"
-    )
+    do_check_userdata_saving = parse_version(actual_bl_version) >= parse_version("1.2.0")
 
     initial_port_settings = modbus_connection.settings
     initial_response_timeout = modbus_connection.response_timeout
@@ -702,7 +766,7 @@ def flash_alive_device(  # pylint:disable=too-many-arguments
                 modbus_connection.get_fw_version(),
                 downloaded_wbfw.version,
             )
-            _do_flash(modbus_connection, downloaded_wbfw, erase_settings, force=force)
+            _do_flash(modbus_connection, downloaded_wbfw, erase_settings, fw_signature, force=force)
             return
         raise UserCancelledError(f"Flashing {fw_signature} has rejected")
 
@@ -724,18 +788,165 @@ def flash_alive_device(  # pylint:disable=too-many-arguments
         debug_info=f"({fw_signature} {modbus_connection.slaveid} {modbus_connection.port})",
     )
     if do_reflash:
-        _do_flash(modbus_connection, downloaded_wbfw, erase_settings, force=force)
+        _do_flash(modbus_connection, downloaded_wbfw, erase_settings, fw_signature, force=force)
 
 
 class DeviceInfo(namedtuple("DeviceInfo", ["name", "modbus_connection"])):
-    __slots__ = ()
+    @cached_property
+    def _description(self):  # devices lists are reported many times at the end of run
+        return f"{self.name} ({self.modbus_connection.slaveid}, {self.modbus_connection.port})"
 
     def __str__(self):
-        return f"{self.name} ({self.modbus_connection.slaveid}, {self.modbus_connection.port})"
+        return self._description
 
 
-def probe_all_devices(  # pylint:disable=too-many-locals
-    driver_config_fname, minimal_response_timeout, instrument=instruments.StopbitsTolerantInstrument
+def _is_still_alive(modbus_connection):
+    """
+    A device, found alive by previous probe, is assumed unchanged, if it still answers an uptime request.
+    """
+    probe_result = db.get_probe_result(modbus_connection.slaveid, modbus_connection.port)
+    if (probe_result is None) or (probe_result[1] != "alive"):
+        return False
+    try:
+        modbus_connection.get_uptime()
+    except Exception:  # pylint:disable=broad-exception-caught
+        logger.debug("Cached probe result is outdated; will probe device fully", exc_info=True)
+        return False
+    with _db_lock:
+        db.save(modbus_connection.slaveid, modbus_connection.port, *probe_result)  # refreshing probe_epoch
+    return True
+
+
+def _probe_device(  # pylint:disable=too-many-arguments
+    device_name, device_slaveid, port, uart_params, response_timeout, instrument, fast_probe
+):
+    """
+    Probing a single device. Returns (state, device_info)
+    """
+    logger.debug(
+        "Probing %s (port: %s, slaveid: %s, uart_params: %s, response_timeout: %.2f)...",
+        device_name,
+        port,
+        device_slaveid,
+        uart_params,
+        response_timeout,
+    )
+    device_info = DeviceInfo(
+        name=device_name,
+        modbus_connection=bindings.WBModbusDeviceBase(
+            device_slaveid,
+            port,
+            *parse_uart_settings_str(uart_params),
+            response_timeout=response_timeout,
+            instrument=instrument,
+        ),
+    )
+    if fast_probe and _is_still_alive(device_info.modbus_connection):
+        return "alive", device_info
+    try:
+        device_info = DeviceInfo(
+            name=device_name,
+            modbus_connection=get_correct_modbus_connection(
+                device_slaveid, port, response_timeout, uart_params, instrument=instrument
+            ),
+        )
+    except ForeignDeviceError:
+        return "foreign", device_info
+    except minimalmodbus.NoResponseError:
+        # check current configured port settings
+        if device_info.modbus_connection.is_in_bootloader():
+            return "in_bootloader", device_info
+        # could be old bootloader with fixed 9600N2 config
+        if device_info.modbus_connection.get_port_settings() != bindings.SerialSettings(9600, "N", 2):
+            device_info.modbus_connection.set_port_settings(9600, "N", 2)
+            if device_info.modbus_connection.is_in_bootloader():
+                return "in_bootloader", device_info
+        return "disconnected", device_info
+
+    try:
+        mb_connection = device_info.modbus_connection
+        fw_signature = mb_connection.get_fw_signature()  # old devices haven't fw_signatures
+        with _db_lock:
+            db.save(mb_connection.slaveid, mb_connection.port, fw_signature, state="alive")
+        return "alive", device_info
+    except bindings.TooOldDeviceError:
+        logger.error("%s is too old and does not support firmware updates!", str(device_info))
+        return "too_old_to_update", device_info
+
+
+def _reprobe_device(device_info, instrument):
+    """
+    Forgetting cached probe result of a device and probing it fully (with the same connection params)
+    """
+    mb_connection = device_info.modbus_connection
+    with _db_lock:
+        db.forget_probe_result(mb_connection.slaveid, mb_connection.port)
+    return _probe_device(
+        device_info.name,
+        mb_connection.slaveid,
+        mb_connection.port,
+        "".join(map(str, mb_connection.get_port_settings())),  # 9600N2
+        mb_connection.response_timeout,
+        instrument,
+        fast_probe=False,
+    )
+
+
+def _get_fw_info_or_reprobe(device_info, instrument):
+    """
+    Fast-probed device could have been replaced by another one with the same slaveid
+    => is probed fully, if fw info could not be read.
+
+    :return: state, device_info, (fw_signature, fw_version) or None (if device is not alive)
+    :rtype: tuple
+    """
+    modbus_errors = (minimalmodbus.ModbusException, ValueError)  # incl. TooOldDeviceError, slaveid mismatch
+    try:
+        return "alive", device_info, _get_fw_info(device_info.modbus_connection)
+    except modbus_errors:
+        logger.debug("Could not read fw of %s; will probe device fully", str(device_info), exc_info=True)
+    state, device_info = _reprobe_device(device_info, instrument)
+    if state == "alive":
+        try:
+            return state, device_info, _get_fw_info(device_info.modbus_connection)
+        except modbus_errors:
+            logger.debug("Could not read fw of %s after full probe", str(device_info), exc_info=True)
+            state = "disconnected"
+    return state, device_info, None
+
+
+def _probe_port_devices(  # pylint:disable=too-many-arguments
+    port, port_params, minimal_response_timeout, instrument, fast_probe, on_probing=None, stop_event=None
+):
+    """
+    Probing devices of a single port one by one (they share a bus). Returns {state: [device_info, ...]}
+    on_probing(port, device_name) is called before probing each device;
+    probing stops before the next device, if stop_event is set.
+    """
+    result = defaultdict(list)
+    uart_params = "".join(map(str, port_params["uart_params"]))  # 9600N2
+    port_response_timeout = port_params["response_timeout"]
+    devices_on_port = port_params["devices"]
+    for device_name, device_slaveid, device_response_timeout in devices_on_port:
+        if stop_event is not None and stop_event.is_set():
+            break
+        if on_probing is not None:
+            on_probing(port, device_name)
+        actual_response_timeout = max(
+            minimal_response_timeout, port_response_timeout, device_response_timeout
+        )
+        state, device_info = _probe_device(
+            device_name, device_slaveid, port, uart_params, actual_response_timeout, instrument, fast_probe
+        )
+        result[state].append(device_info)
+    return result
+
+
+def probe_all_devices(
+    driver_config_fname,
+    minimal_response_timeout,
+    instrument=instruments.StopbitsTolerantInstrument,
+    fast_probe=True,
 ):  # maybe rework entire data model (to get rid of passing lists)
     """
     Acquiring states of all devices, added to config.
@@ -745,67 +956,53 @@ def probe_all_devices(  # pylint:disable=too-many-locals
         disconnected - a dummy-record in config
         too_old_to_update - old wb devices, haven't bootloader
         foreign_devices - non-wb devices, defined in config
+
+    With fast_probe, devices, found alive by previous run, are checked by a single uptime request.
+    Ports are independent buses => are probed concurrently, if accessed via pyserial
+    (devices of a port are probed one by one).
     """
     result = defaultdict(list)
 
     logger.info("Will probe all devices on enabled serial ports of %s:", driver_config_fname)
-    for port, port_params in get_devices_on_driver(driver_config_fname).items():
-        uart_params = "".join(map(str, port_params["uart_params"]))  # 9600N2
-        port_response_timeout = port_params["response_timeout"]
-        devices_on_port = port_params["devices"]
-        for device_name, device_slaveid, device_response_timeout in devices_on_port:
-            actual_response_timeout = max(
-                minimal_response_timeout, port_response_timeout, device_response_timeout
-            )
-            # pylint:disable=line-too-long
-            desc_str = f"Probing {device_name} (port: {port}, slaveid: {device_slaveid}, uart_params: {uart_params}, response_timeout: {actual_response_timeout:.2f})..."
-            with spinner(description=desc_str, tqdm_kwargs={"bar_format": "{desc} (elapsed: {elapsed})"}):
-                device_info = DeviceInfo(
-                    name=device_name,
-                    modbus_connection=bindings.WBModbusDeviceBase(
-                        device_slaveid,
-                        port,
-                        *parse_uart_settings_str(uart_params),
-                        response_timeout=actual_response_timeout,
-                        instrument=instrument,
-                    ),
+    devices_on_driver = get_devices_on_driver(driver_config_fname)
+    if not devices_on_driver:
+        return result
+
+    desc_str = f"Probing devices on {', '.join(devices_on_driver)}..."
+    with spinner(description=desc_str, tqdm_kwargs={"bar_format": "{desc} (elapsed: {elapsed})"}) as pbar:
+        probing_now = {}  # {port: device_name}
+        pbar_lock = threading.Lock()  # ports are probed concurrently
+        stop_event = threading.Event()
+
+        def _show_probing(port, device_name):
+            with pbar_lock:
+                probing_now[port] = device_name
+                pbar.set_description_str(
+                    "Probing %s..." % ", ".join(f"{name} ({port})" for port, name in probing_now.items())
                 )
-                try:
-                    device_info = DeviceInfo(
-                        name=device_name,
-                        modbus_connection=get_correct_modbus_connection(
-                            device_slaveid, port, actual_response_timeout, uart_params, instrument=instrument
-                        ),
-                    )
-                except ForeignDeviceError:
-                    result["foreign"].append(device_info)
-                    continue
-                except minimalmodbus.NoResponseError:
-                    # check current configured port settings
-                    if device_info.modbus_connection.is_in_bootloader():
-                        result["in_bootloader"].append(device_info)
-                        continue
-                    # could be old bootloader with fixed 9600N2 config
-                    if device_info.modbus_connection.get_port_settings() != bindings.SerialSettings(
-                        9600, "N", 2
-                    ):
-                        device_info.modbus_connection.set_port_settings(9600, "N", 2)
-                        if device_info.modbus_connection.is_in_bootloader():
-                            result["in_bootloader"].append(device_info)
-                            continue
-                    result["disconnected"].append(device_info)
-                    continue
 
-                try:
-                    mb_connection = device_info.modbus_connection
-                    db.save(
-                        mb_connection.slaveid, mb_connection.port, mb_connection.get_fw_signature()
-                    )  # old devices haven't fw_signatures
-                    result["alive"].append(device_info)
-                except bindings.TooOldDeviceError:
-                    logger.error("%s is too old and does not support firmware updates!", str(device_info))
-                    result["too_old_to_update"].append(device_info)
+        def _probe_port(port_item):
+            port, port_params = port_item
+            return _probe_port_devices(
+                port, port_params, minimal_response_timeout, instrument, fast_probe, _show_probing, stop_event
+            )
 
+        if issubclass(instrument, instruments.PyserialBackendInstrument):
+            executor = ThreadPoolExecutor(max_workers=len(devices_on_driver))
+            try:
+                ports_results = list(executor.map(_probe_port, devices_on_driver.items()))
+            except KeyboardInterrupt:
+                # not waiting for the whole ports to be probed: workers stop after current devices
+                stop_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+        else:  # rpc instruments share serial settings and mqtt connection between ports
+            ports_results = list(map(_probe_port, devices_on_driver.items()))
+
+    for port_result in ports_results:  # keeping ports order of driver config
+        for state, devices_infos in port_result.items():
+            result[state].extend(devices_infos)
     return result
 
 
@@ -824,12 +1021,17 @@ def _update_all(  # pylint:disable=too-many-branches,too-many-statements
         CONFIG["SERIAL_DRIVER_CONFIG_FNAME"], minimal_response_timeout, instrument=instrument
     )
     cmd_status = defaultdict(list)
+    downloaded_fw_by_endpoint = {}  # devices of the same model share a single firmware file
 
     for device_info in probing_result["alive"]:
-        fw_signature = device_info.modbus_connection.get_fw_signature()
+        state, device_info, fw_info = _get_fw_info_or_reprobe(device_info, instrument)
+        if state != "alive":
+            probing_result[state].append(device_info)
+            continue
+        fw_signature, local_device_version = fw_info
         try:
             latest_remote_version, released_fw_endpoint = get_released_fw(
-                fw_signature, RELEASE_INFO
+                fw_signature, RELEASE_INFO, RELEASE_URLS
             )  # auto-updating only from releases
         except NoReleasedFwError as e:
             logger.error(e)
@@ -841,7 +1043,6 @@ def _update_all(  # pylint:disable=too-many-branches,too-many-statements
             ).get_latest_version_number(
                 fw_signature
             )  # to guess, is reflash needed or not
-        local_device_version = device_info.modbus_connection.get_fw_version()
 
         do_reflash, skip_reason = is_reflash_necessary(
             actual_version=local_device_version,
@@ -851,24 +1052,26 @@ def _update_all(  # pylint:disable=too-many-branches,too-many-statements
             debug_info=f"({device_info})",
         )
         if do_reflash:
+            if released_fw_endpoint not in downloaded_fw_by_endpoint:
+                downloaded_fw_by_endpoint[released_fw_endpoint] = fw_downloader.download_remote_file(
+                    urllib.parse.urljoin(CONFIG["ROOT_URL"], released_fw_endpoint)
+                )
             downloaded_wbfw = DownloadedWBFW(
                 mode=MODE_FW,
-                fpath=fw_downloader.download_remote_file(
-                    urllib.parse.urljoin(CONFIG["ROOT_URL"], released_fw_endpoint)
-                ),
+                fpath=downloaded_fw_by_endpoint[released_fw_endpoint],
                 version=latest_remote_version,
             )
-            cmd_status["to_perform"].append([device_info, downloaded_wbfw])
+            cmd_status["to_perform"].append([device_info, downloaded_wbfw, fw_signature])
         else:
             if skip_reason == SkipUpdateReason.gone_ahead:
                 cmd_status["skipped"].append(device_info)
 
-    for device_info, downloaded_wbfw in cmd_status[
+    for device_info, downloaded_wbfw, fw_signature in cmd_status[
         "to_perform"
     ]:  # Devices, were alive and supported fw_updates
         logger.info("Flashing firmware to %s", str(device_info))
         try:
-            _do_flash(device_info.modbus_connection, downloaded_wbfw, False, force=force)
+            _do_flash(device_info.modbus_connection, downloaded_wbfw, False, fw_signature, force=force)
             if not is_bootloader_latest(device_info.modbus_connection):
                 cmd_status["bl_update_available"].append(device_info)
         except fw_flasher.FlashingError as e:
@@ -1040,37 +1243,57 @@ def _recover_all(minimal_response_timeout, force=False, instrument=instruments.S
     )
 
 
+def _has_opened_any(fd_dir, paths):
+    for fd in os.listdir(fd_dir):
+        try:
+            if os.readlink(os.path.join(fd_dir, fd)) in paths:
+                return True
+        except OSError:  # fd has been closed while scanning
+            continue
+    return False
+
+
+def _get_clients_pids(*ports):
+    """
+    Scanning /proc for processes, having any of ports opened (as fuser does).
+
+    :return: {pid: cmdline}
+    :rtype: dict
+    """
+    ports = set(os.path.realpath(port) for port in ports)
+    own_pid = os.getpid()
+    ret = {}
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        if int(pid) == own_pid:
+            continue
+        fd_dir = os.path.join("/proc", pid, "fd")
+        try:
+            if not _has_opened_any(fd_dir, ports):
+                continue
+            with open(os.path.join("/proc", pid, "cmdline"), "rb") as fp:
+                cmdline = fp.read()
+        except OSError:  # process has gone or is not accessible
+            continue
+        ret[int(pid)] = " ".join(cmdline.decode("utf-8", errors="replace").split("\0")).strip()
+    logger.debug("Clients of %s: %s", ", ".join(ports), str(ret))
+    return ret
+
+
 def _get_clients(*ports):
-    ports = " ".join(ports)
-    cmd_str = f"fuser {ports}"
-    logger.debug("Will run: %s", cmd_str)
-    try:
-        pids = str(subprocess.check_output(cmd_str, shell=True, stderr=subprocess.DEVNULL), encoding="utf-8")
-    except subprocess.CalledProcessError:
-        logger.debug("No clients for %s found", ports)
-        return []
-    pids = [pid.strip() for pid in pids.split()]
-    pids = " ".join(set(pids))
-    logger.debug("Clients of %s: %s", ports, pids)
-    cmd_str = f"ps -o cmd= {pids}"
-    logger.debug("Will run: %s", cmd_str)
-    try:
-        procs = str(subprocess.check_output(cmd_str, shell=True, stderr=subprocess.DEVNULL), encoding="utf-8")
-        return [proc.strip() for proc in procs.split("\n") if proc.strip()]
-    except subprocess.CalledProcessError:
-        logger.debug("No pid from %s is alive now", pids)
-        return []
+    return list(_get_clients_pids(*ports).values())
 
 
-def _send_signal(signal, *ports):
+def _send_signal(signum, *ports):
     """
     Use pausing/resuming of processes, accessing port
     to handle cases, like <wb-mqtt-serial -c config.conf>
     """
-    ports = " ".join(ports)
-    cmd_str = f"fuser -k {signal} {ports}"
-    logger.debug("Will run: %s", cmd_str)
-    subprocess.call(cmd_str, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for pid in _get_clients_pids(*ports):
+        logger.debug("Sending %s to %d", signal.Signals(signum).name, pid)
+        try:
+            os.kill(pid, signum)
+        except OSError:
+            logger.debug("Could not send %s to %d", signal.Signals(signum).name, pid, exc_info=True)
 
 
 def stop_clients(force, *ports):
@@ -1088,23 +1311,89 @@ def stop_clients(force, *ports):
         ):
             die(f'Stop {" ".join(actual_clients)} manually!')
     if actual_clients:
-        _send_signal("-STOP", *ports)
+        _send_signal(signal.SIGSTOP, *ports)
 
 
 def resume_clients(*ports):
-    _send_signal("-CONT", *ports)
+    _send_signal(signal.SIGCONT, *ports)
 
 
-def get_port_settings(port_fname):
+class PortStateManager:
     """
     python-serial does not remember initial port settings (bd, parity, etc...)
     => restoring it manually after all operations to let wb-mqtt-serial work again
+
+    Each port is opened once (on first use) and kept open for the whole session.
+    Ports, could not be opened, are skipped (with a warning).
+
+    Low-latency mode (enabled by wb_modbus.instruments) is kept by tty driver after closing the port
+    => is restored too.
     """
-    with open(port_fname, encoding="utf-8") as port:
-        fd = port.fileno()
-        return termios.tcgetattr(fd)
 
+    ASYNC_LOW_LATENCY = 0x2000  # serial_struct.flags bit (linux/tty_flags.h)
 
-def set_port_settings(port_fname, termios_settings):
-    with open(port_fname, encoding="utf-8") as port:
-        termios.tcsetattr(port.fileno(), termios.TCSANOW, termios_settings)
+    def __init__(self, *ports):
+        self._ports = {}
+        self._initial_settings = {}
+        self._initial_low_latency = {}
+        for port_fname in ports:
+            try:
+                self.get_port_settings(port_fname)
+            except (OSError, termios.error) as e:  # absent or busy port should not block others
+                logger.warning("Could not save initial settings of %s: %s", port_fname, e)
+                continue
+            try:
+                self._initial_low_latency[port_fname] = self.get_low_latency(port_fname)
+            except OSError:  # port has no serial_struct (e.g. pty)
+                logger.debug("Could not get low latency mode of %s", port_fname, exc_info=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.restore()
+
+    def _get_fd(self, port_fname):
+        if port_fname not in self._ports:
+            # no tty line discipline init and no controlling-terminal side effects on open
+            self._ports[port_fname] = os.open(port_fname, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        return self._ports[port_fname]
+
+    def get_port_settings(self, port_fname):
+        termios_settings = termios.tcgetattr(self._get_fd(port_fname))
+        self._initial_settings.setdefault(port_fname, termios_settings)
+        return termios_settings
+
+    def set_port_settings(self, port_fname, termios_settings):
+        termios.tcsetattr(self._get_fd(port_fname), termios.TCSANOW, termios_settings)
+
+    def _get_serial_struct(self, port_fname):
+        buf = array.array("i", [0] * 32)  # as pyserial does
+        fcntl.ioctl(self._get_fd(port_fname), termios.TIOCGSERIAL, buf)
+        return buf
+
+    def get_low_latency(self, port_fname):
+        return bool(self._get_serial_struct(port_fname)[4] & self.ASYNC_LOW_LATENCY)  # [4] is flags
+
+    def set_low_latency(self, port_fname, low_latency):
+        buf = self._get_serial_struct(port_fname)
+        if low_latency:
+            buf[4] |= self.ASYNC_LOW_LATENCY
+        else:
+            buf[4] &= ~self.ASYNC_LOW_LATENCY
+        fcntl.ioctl(self._get_fd(port_fname), termios.TIOCSSERIAL, buf)
+
+    def restore(self):
+        for port_fname, termios_settings in self._initial_settings.items():
+            logger.debug("Restoring initial port settings of %s", port_fname)
+            self.set_port_settings(port_fname, termios_settings)
+        for port_fname, low_latency in self._initial_low_latency.items():
+            try:
+                self.set_low_latency(port_fname, low_latency)
+            except OSError:
+                logger.warning("Could not restore low latency mode of %s", port_fname, exc_info=True)
+        for fd in self._ports.values():
+            os.close(fd)
+        self._ports.clear()
+        self._initial_settings.clear()
+        self._initial_low_latency.clear()
@@ -3,6 +3,7 @@
 
 import logging
 import os
+import re
 import sys
 
 from . import CONFIG
@@ -17,12 +18,17 @@ ANSI_COLORS = {
 }
 
 
+_RESET = ANSI_COLORS["RESET"]
+_ANSI_SGR = re.compile(r"\x1b\[[0-9;]*m")
+
+
 def colorize(msg, color):
     if not isinstance(msg, str):
         raise RuntimeError("Only string could be colored!")
-    if color not in ANSI_COLORS:
+    prefix = ANSI_COLORS.get(color)
+    if prefix is None:
         raise RuntimeError(f'Unsupported color {color}. Try one of {", ".join(ANSI_COLORS.keys())}')
-    return ANSI_COLORS[color] + msg + ANSI_COLORS["RESET"]
+    return f"{prefix}{msg}{_RESET}"
 
 
 class HidingTracebackFilter(logging.Filter):  # pylint: disable=too-few-public-methods
@@ -32,12 +38,18 @@ class HidingTracebackFilter(logging.Filter):  # pylint: disable=too-few-public-m
 
     def __init__(self, hide_tb=False):  # pylint:disable=super-init-not-called
         self.hide_tb = hide_tb
-
-    def _hide_tb(self, record):
-        if self.hide_tb:
-            record._exc_info_hidden, record.exc_info = record.exc_info, None
-            record.exc_text = None
-        elif hasattr(record, "_exc_info_hidden"):  # Traceback was already hidden by another handler
+        self._hide_tb = self._do_hide_tb if hide_tb else self._restore_tb  # chosen once, not per record
+
+    @staticmethod
+    def _do_hide_tb(record):
+        if record.exc_info is None:
+            return
+        record._exc_info_hidden, record.exc_info = record.exc_info, None
+        record.exc_text = None
+
+    @staticmethod
+    def _restore_tb(record):
+        if "_exc_info_hidden" in record.__dict__:  # Traceback was already hidden by another handler
             record.exc_info = record._exc_info_hidden  # pylint: disable=protected-access
             del record._exc_info_hidden
 
@@ -74,10 +86,22 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: colorize(FMT, "RED_BOLD"),
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._default_formatter = logging.Formatter(self.FMT)
+        self._formatters = {level: logging.Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()}
+
+    def format(self, record):
+        return self._formatters.get(record.levelno, self._default_formatter).format(record)
+
+
+class AnsiStrippingFormatter(logging.Formatter):
+    """
+    Messages could contain colorized parts (for user's terminal); syslog should not store escape sequences.
+    """
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno, self.FMT)
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        return _ANSI_SGR.sub("", super().format(record))
 
 
 def setup_user_logger(name, least_visible_level):
@@ -123,7 +147,7 @@ def setup_syslog_logger(name):
     if os.path.exists(_default_syslog_sock):
         syslog_handler = logging.handlers.SysLogHandler(address=_default_syslog_sock, facility="user")
         syslog_handler.setFormatter(
-            logging.Formatter(fmt=CONFIG["SYSLOG_MESSAGE_FMT"], datefmt=CONFIG["LOG_DATETIME_FMT"])
+            AnsiStrippingFormatter(fmt=CONFIG["SYSLOG_MESSAGE_FMT"], datefmt=CONFIG["LOG_DATETIME_FMT"])
         )
         syslog_handler.setLevel(CONFIG["SYSLOG_LOGLEVEL"])
         logging.getLogger(name).handlers.insert(
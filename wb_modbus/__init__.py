@@ -17,7 +17,8 @@ ALLOWED_PARITIES = OrderedDict([("N", 0), ("O", 1), ("E", 2)])
 DEBUG = False
 
 
-WBMAP_MARKER = re.compile("\S*MAP\d+\S*")  # *MAP%d* matches
+WBMAP_MARKER = re.compile(r"\S*MAP\d+\S*")  # *MAP%d* matches
+UART_SETTINGS_STR = re.compile(r"(?P<baudrate>\d+)(?P<parity>[A-Z])(?P<stopbits>\d+)$")  # 9600N2
 
 
 class SettingsParsingError(Exception):
@@ -31,15 +32,19 @@ def parse_uart_settings_str(settings_str):
     :return: [baudrate, parity, stopbits]
     :rtype: list
     """
-    if re.match("\d*[A-Z]\d*", settings_str):
-        baudrate, stopbits = re.split("[A-Z]", settings_str)
-        parity = settings_str.replace(baudrate, "").replace(stopbits, "").strip()
+    mat = UART_SETTINGS_STR.match(settings_str.strip())
+    if mat:
+        baudrate, parity, stopbits = (
+            int(mat.group("baudrate")),
+            mat.group("parity"),
+            int(mat.group("stopbits")),
+        )
         if (
-            (int(baudrate) in ALLOWED_BAUDRATES)
-            and (int(stopbits) in ALLOWED_STOPBITS)
+            (baudrate in ALLOWED_BAUDRATES)
+            and (stopbits in ALLOWED_STOPBITS)
             and (parity in ALLOWED_PARITIES.keys())
         ):
-            return [int(baudrate), parity, int(stopbits)]
+            return [baudrate, parity, stopbits]
         else:
             raise SettingsParsingError(
                 "Got invalid uart params str: %s\nAllowed values:\n\tBAUDRATES: %s\n\tSTOPBITS: %s\n\tPARITIES: %s"
@@ -2,17 +2,16 @@
 # -*- coding: utf-8 -*-
 # pylint: skip-file
 import time
-from binascii import unhexlify
 from collections import namedtuple
-from copy import deepcopy
-from functools import wraps
+from functools import partialmethod, wraps
 from itertools import product
 
+import wb_modbus
+
 from . import (
     ALLOWED_BAUDRATES,
     ALLOWED_PARITIES,
     ALLOWED_STOPBITS,
-    ALLOWED_UNSUCCESSFUL_TRIES,
     CLOSE_PORT_AFTER_EACH_CALL,
     DEBUG,
     WBMAP_MARKER,
@@ -22,6 +21,10 @@ from . import (
 )
 
 SerialSettings = namedtuple("SerialSettings", "baudrate parity stopbits")
+UART_SETTINGS_COMBINATIONS = tuple(
+    product(ALLOWED_BAUDRATES, ALLOWED_PARITIES.keys(), ALLOWED_STOPBITS)
+)  # most common (9600N2) first
+Metadata = namedtuple("Metadata", "device_signature fw_version serial_number fw_signature uptime")
 
 
 class TooOldDeviceError(minimalmodbus.ModbusException):
@@ -30,6 +33,12 @@ class TooOldDeviceError(minimalmodbus.ModbusException):
     """
 
 
+class PartialResponseError(minimalmodbus.ModbusException):
+    """
+    Device has answered the first request of a sequence, but has failed the following ones.
+    """
+
+
 class UARTSettingsNotFoundError(Exception):
     pass
 
@@ -47,9 +56,10 @@ def apply_serial_settings(f):
     return wrapper
 
 
-def force(retries=ALLOWED_UNSUCCESSFUL_TRIES):
+def force(retries=None):
     """
     A decorator, applying settings to serial port and handling accidential connection errors on bus.
+    Number of tries is wb_modbus.ALLOWED_UNSUCCESSFUL_TRIES (at the moment of call), if not specified.
     """
     errtypes = (minimalmodbus.ModbusException, ValueError)
 
@@ -57,21 +67,23 @@ def force(retries=ALLOWED_UNSUCCESSFUL_TRIES):
         @wraps(f)
         def wrapper(*args, **kwargs):
             tries = kwargs.pop("retries", retries)
+            if tries is None:
+                tries = wb_modbus.ALLOWED_UNSUCCESSFUL_TRIES
             thrown_exc = None
-            f_args = [repr(a) for a in args]
-            f_kwargs = ["%s=%s" % (k, repr(v)) for k, v in kwargs.items()]
-            f_signature = "%s(%s)" % (f.__name__, ", ".join(f_args + f_kwargs))
+            f_signature = None
             for i in range(tries):
                 try:
                     return f(*args, **kwargs)
                 except errtypes as e:
                     thrown_exc = e
+                    if f_signature is None:  # built only on failures; successful calls are the common case
+                        f_args = [repr(a) for a in args]
+                        f_kwargs = ["%s=%s" % (k, repr(v)) for k, v in kwargs.items()]
+                        f_signature = "%s(%s)" % (f.__name__, ", ".join(f_args + f_kwargs))
                     logger.debug("f = %s not succeed (try %d/%d): %s", f_signature, i + 1, tries, e)
-            else:
-                if thrown_exc:  # python3 wants exception to be defined already
-                    raise thrown_exc
-                else:
-                    raise RuntimeError("Decorator has not returned! Something goes wrong!")
+            if thrown_exc:  # python3 wants exception to be defined already
+                raise thrown_exc
+            raise RuntimeError("Decorator has not returned! Something goes wrong!")
 
         return wrapper
 
@@ -90,12 +102,10 @@ def _debug_info(message):
 
 
 def close_all_modbus_ports():
-    for serial_instance in minimalmodbus._serialports.values():
+    for serial_instance in tuple(minimalmodbus._serialports.values()):
         if serial_instance.is_open:
-            logger.debug("Closing serial instance: %s" % str(serial_instance))
+            logger.debug("Closing serial instance: %s", serial_instance)
             serial_instance.close()
-        else:
-            logger.debug("Serial instance %s has already closed" % serial_instance)
 
 
 def _validate_param(param, sequence):
@@ -105,6 +115,12 @@ def _validate_param(param, sequence):
         )
 
 
+def _validate_uart_settings(baudrate, parity, stopbits):
+    _validate_param(baudrate, ALLOWED_BAUDRATES)
+    _validate_param(parity, ALLOWED_PARITIES)
+    _validate_param(stopbits, ALLOWED_STOPBITS)
+
+
 class MinimalModbusAPIWrapper(object):
     """
     A generic wrapper around minimalmodbus's api. Handles connection errors;
@@ -112,6 +128,8 @@ class MinimalModbusAPIWrapper(object):
     Redirects minimalmodbus's debug messages to logging.
     """
 
+    _found_uart_settings = {}  # (port, slaveid): settings; shared between instances to be tried first
+
     def __init__(
         self,
         addr,
@@ -142,7 +160,11 @@ class MinimalModbusAPIWrapper(object):
         :type settings_dict: dict
         """
         self.settings = settings_namedtuple
-        self.device.serial.apply_settings(self.settings._asdict())  # only sets params into serial's instance
+        serial = self.device.serial
+        if all(getattr(serial, key) == value for key, value in zip(self.settings._fields, self.settings)):
+            # Port object is shared between instruments on the same port: comparing against the port itself
+            return
+        serial.apply_settings(self.settings._asdict())  # only sets params into serial's instance
         """
         Settings are writing to serial's fd (posix) at:
             - each port opening (before next call to device, if close_port_after_each_call param is set in Instrument);
@@ -162,10 +184,7 @@ class MinimalModbusAPIWrapper(object):
         :param stopbits: serial port stopbits
         :type stopbits: int
         """
-        for param, allowed_row in zip(
-            [baudrate, parity, stopbits], [ALLOWED_BAUDRATES, ALLOWED_PARITIES.keys(), ALLOWED_STOPBITS]
-        ):
-            _validate_param(param, allowed_row)
+        _validate_uart_settings(baudrate, parity, stopbits)
         settings = SerialSettings(baudrate=int(baudrate), parity=parity, stopbits=int(stopbits))
         self._set_port_settings_raw(settings)
         logger.debug("Set %s to %s", str(self.settings), self.port)
@@ -173,6 +192,24 @@ class MinimalModbusAPIWrapper(object):
     def get_port_settings(self):
         return self.settings
 
+    def _get_uart_settings_to_try(self):
+        """
+        Actual settings (None) at first, then ones found before for the same device,
+        then all other allowed ones.
+        """
+        first_settings = [self.get_port_settings()]
+        found_before = self._found_uart_settings.get((self.port, self.slaveid))
+        if found_before is not None and found_before != first_settings[0]:
+            first_settings.append(found_before)
+        settings_to_try = [None] + first_settings[1:]
+        settings_to_try.extend(
+            settings for settings in UART_SETTINGS_COMBINATIONS if settings not in first_settings
+        )
+        return settings_to_try
+
+    def _remember_uart_settings(self):
+        self._found_uart_settings[(self.port, self.slaveid)] = self.get_port_settings()
+
     @apply_serial_settings
     @force()
     def read_bit(self, addr):
@@ -333,106 +370,36 @@ class MinimalModbusAPIWrapper(object):
         """
         self.device.write_register(addr, value, 0, 6, signed=True)
 
-    @apply_serial_settings
-    @force()
-    def read_u32_big_endian(self, addr, byteswap=False):
-        """
-        Reading two consecutive 16 bit registers and interpreting value as one unsigned 32 bit integer with Big-Endian byteorder.
-
-        :param addr: address of first register
-        :type addr: int
-        :param byteswap: are bytes swapped or not, defaults to False
-        :type byteswap: bool, optional
-        :return: unsigned 32 bit integer
-        :rtype: int
-        """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_BIG_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_BIG
-        return self.device.read_long(addr, 3, signed=False, byteorder=order)
-
-    @apply_serial_settings
-    @force()
-    def read_u32_little_endian(self, addr, byteswap=False):
-        """
-        Reading two consecutive 16 bit registers and interpreting value as one unsigned 32 bit integer with Little-Endian byteorder.
-
-        :param addr: address of first register
-        :type addr: int
-        :param byteswap: are bytes swapped or not, defaults to False
-        :type byteswap: bool, optional
-        :return: unsigned 32 bit integer
-        :rtype: int
-        """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_LITTLE_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_LITTLE
-        return self.device.read_long(addr, 3, signed=False, byteorder=order)
-
-    @apply_serial_settings
-    @force()
-    def read_s32_big_endian(self, addr, byteswap=False):
-        """
-        Reading two consecutive 16 bit registers and interpreting value as one signed 32 bit integer with Big-Endian byteorder.
-
-        :param addr: address of first register
-        :type addr: int
-        :param byteswap: are bytes swapped or not, defaults to False
-        :type byteswap: bool, optional
-        :return: signed 32 bit integer
-        :rtype: int
-        """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_BIG_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_BIG
-        return self.device.read_long(addr, 3, signed=True, byteorder=order)
+    _LONG_BYTEORDERS = {  # (endianness, byteswap): minimalmodbus's byteorder
+        ("big", False): minimalmodbus.BYTEORDER_BIG,
+        ("big", True): minimalmodbus.BYTEORDER_BIG_SWAP,
+        ("little", False): minimalmodbus.BYTEORDER_LITTLE,
+        ("little", True): minimalmodbus.BYTEORDER_LITTLE_SWAP,
+    }
 
     @apply_serial_settings
     @force()
-    def read_s32_little_endian(self, addr, byteswap=False):
+    def _read_32(self, addr, byteswap=False, *, endianness, signed):
         """
-        Reading two consecutive 16 bit registers and interpreting value as one signed 32 bit integer with Little-Endian byteorder.
+        Reading two consecutive 16 bit registers and interpreting value as one 32 bit integer.
+        Public read_{u,s}32_{big,little}_endian methods are this one with fixed endianness and signedness.
 
         :param addr: address of first register
         :type addr: int
         :param byteswap: are bytes swapped or not, defaults to False
         :type byteswap: bool, optional
-        :return: signed 32 bit integer
+        :return: 32 bit integer
         :rtype: int
         """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_LITTLE_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_LITTLE
-        return self.device.read_long(addr, 3, signed=True, byteorder=order)
-
-    @apply_serial_settings
-    @force()
-    def write_u32_big_endian(self, addr, value, byteswap=False):
-        """
-        Writing an unsigned 32 bit integer to two consecutive 16 bit holding registers with Big-Endian byteorder.
-
-        :param addr: address of first register
-        :type addr: int
-        :param value: value, will be written to regs
-        :type value: int
-        :param byteswap: will bytes be swapped or not, defaults to False
-        :type byteswap: bool, optional
-        """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_BIG_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_BIG
-        self.device.write_long(addr, value, signed=False, byteorder=order)
+        order = self._LONG_BYTEORDERS[(endianness, byteswap)]
+        return self.device.read_long(addr, 3, signed=signed, byteorder=order)
 
     @apply_serial_settings
     @force()
-    def write_u32_little_endian(self, addr, value, byteswap=False):
+    def _write_32(self, addr, value, byteswap=False, *, endianness, signed):
         """
-        Writing an unsigned 32 bit integer to two consecutive 16 bit holding registers with Little-Endian byteorder.
+        Writing a 32 bit integer to two consecutive 16 bit holding registers.
+        Public write_{u,s}32_{big,little}_endian methods are this one with fixed endianness and signedness.
 
         :param addr: address of first register
         :type addr: int
@@ -441,49 +408,17 @@ class MinimalModbusAPIWrapper(object):
         :param byteswap: will bytes be swapped or not, defaults to False
         :type byteswap: bool, optional
         """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_LITTLE_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_LITTLE
-        self.device.write_long(addr, value, signed=False, byteorder=order)
+        order = self._LONG_BYTEORDERS[(endianness, byteswap)]
+        self.device.write_long(addr, value, signed=signed, byteorder=order)
 
-    @apply_serial_settings
-    @force()
-    def write_s32_big_endian(self, addr, value, byteswap=False):
-        """
-        Writing a signed 32 bit integer to two consecutive 16 bit holding registers with Big-Endian byteorder.
-
-        :param addr: address of first register
-        :type addr: int
-        :param value: value, will be written to regs
-        :type value: int
-        :param byteswap: will bytes be swapped or not, defaults to False
-        :type byteswap: bool, optional
-        """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_BIG_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_BIG
-        self.device.write_long(addr, value, signed=True, byteorder=order)
-
-    @apply_serial_settings
-    @force()
-    def write_s32_little_endian(self, addr, value, byteswap=False):
-        """
-        Writing a signed 32 bit integer to two consecutive 16 bit holding registers with Little-Endian byteorder.
-
-        :param addr: address of first register
-        :type addr: int
-        :param value: value, will be written to regs
-        :type value: int
-        :param byteswap: will bytes be swapped or not, defaults to False
-        :type byteswap: bool, optional
-        """
-        if byteswap:
-            order = minimalmodbus.BYTEORDER_LITTLE_SWAP
-        else:
-            order = minimalmodbus.BYTEORDER_LITTLE
-        self.device.write_long(addr, value, signed=True, byteorder=order)
+    read_u32_big_endian = partialmethod(_read_32, endianness="big", signed=False)
+    read_u32_little_endian = partialmethod(_read_32, endianness="little", signed=False)
+    read_s32_big_endian = partialmethod(_read_32, endianness="big", signed=True)
+    read_s32_little_endian = partialmethod(_read_32, endianness="little", signed=True)
+    write_u32_big_endian = partialmethod(_write_32, endianness="big", signed=False)
+    write_u32_little_endian = partialmethod(_write_32, endianness="little", signed=False)
+    write_s32_big_endian = partialmethod(_write_32, endianness="big", signed=True)
+    write_s32_little_endian = partialmethod(_write_32, endianness="little", signed=True)
 
     def _to_wb_str(self, modbus_bytestr):
         """
@@ -497,13 +432,11 @@ class MinimalModbusAPIWrapper(object):
         :return: a string with cut trailing null-bytes
         :rtype: str
         """
-        empty_chars_placeholders = ("00", "FF", " ")
-        ret = minimalmodbus._hexlify(modbus_bytestr)
-        for placeholder in empty_chars_placeholders:  # Clearing a string to only meaningful bytes
-            ret = ret.replace(placeholder, "")  # 'A1B2C3' bytes-only string
-        return str(
-            unhexlify(ret).decode(encoding="utf-8", errors="ignore")
-        ).strip()  # TODO: "backslashreplace" when drop py2
+        empty_chars_placeholders = b"\x00\xff"
+        ret = modbus_bytestr.encode("latin1").translate(
+            None, empty_chars_placeholders
+        )  # Clearing a string to only meaningful bytes per one pass
+        return ret.decode(encoding="utf-8", errors="ignore").strip()  # TODO: "backslashreplace" when drop py2
 
     @apply_serial_settings
     @force()
@@ -522,17 +455,19 @@ def auto_find_uart_settings(method_to_decorate):
 
     @wraps(method_to_decorate)
     def wrapper(self, *args, **kwargs):
-        allowed_parities = ALLOWED_PARITIES.keys()
-        for settings in product(ALLOWED_BAUDRATES, allowed_parities, ALLOWED_STOPBITS):
+        for settings in self._get_uart_settings_to_try():
+            if settings is not None:
+                logger.debug("Trying serial port settings: %s" % str(settings))
+                self.set_port_settings(*settings)
             try:
-                return method_to_decorate(self, *args, **kwargs)
+                ret = method_to_decorate(self, *args, **kwargs)
             except IOError:
-                self.set_port_settings(*settings)
-                logger.debug("Trying serial port settings: %s" % str(settings))
-        else:
-            raise UARTSettingsNotFoundError(
-                "All serial port settings were not successful! Check device slaveid/power!"
-            )
+                continue
+            self._remember_uart_settings()
+            return ret
+        raise UARTSettingsNotFoundError(
+            "All serial port settings were not successful! Check device slaveid/power!"
+        )
 
     return wrapper
 
@@ -564,7 +499,24 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
     FIRMWARE_SIGNATURE_LENGTH = 12  # 290-301 u16 regs
     BOOTLOADER_VERSION_LENGTH = 8  # 330-337 u16 regs
 
+    COMMON_REGS_LAYOUT = {  # key of COMMON_REGS_MAP: (number of u16 regs, value type)
+        "uptime": (2, "u32"),
+        "baudrate": (1, "u16"),
+        "parity": (1, "u16"),
+        "stopbits": (1, "u16"),
+        "v_in": (1, "u16"),
+        "slaveid": (1, "u16"),
+        "device_signature": (DEVICE_SIGNATURE_LENGTH, "str"),
+        "fw_version": (FIRMWARE_VERSION_LENGTH, "str"),
+        "serial_number": (2, "u32"),
+        "fw_signature": (FIRMWARE_SIGNATURE_LENGTH, "str"),
+    }
+    MAX_REGS_PER_READ = 125  # modbus limitation
+    MAX_REGS_GAP_PER_READ = 4  # few unused regs are cheaper, than one more message; holes may be unreadable
+    UART_CHAR_BITS = 11  # start bit + 8 data bits + parity and/or stop bits
+
     BOOTLOADER_INFOBLOCK_MAGIC_TIMEOUT = 1.0  # Bl needs some time to perform info-block magic
+    BOOTLOADER_ENTER_TIMEOUT = 0.5  # Device stops answering, when has gone to bootloader
 
     def __init__(
         self,
@@ -588,6 +540,14 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         )
         self.set_response_timeout(response_timeout)
         self.instrument = instrument
+        self._metadata_cache = {}  # signatures, versions and sn do not change until reboot => are read once
+
+    def clear_metadata_cache(self):
+        """
+        Forgetting read device_signature, fw_signature, fw_version, serial_number and bootloader_version.
+        Should be called, if device has been rebooted or flashed.
+        """
+        self._metadata_cache.clear()
 
     def set_response_timeout(self, response_timeout):
         self.response_timeout = response_timeout
@@ -605,21 +565,22 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         :rtype: dict
         """
         initial_uart_settings = self.get_port_settings()
-        allowed_parities = ALLOWED_PARITIES.keys()
-        for settings in product(ALLOWED_BAUDRATES, allowed_parities, ALLOWED_STOPBITS):
+        for settings in self._get_uart_settings_to_try():
+            if settings is not None:
+                logger.debug("Trying serial port settings: %s" % str(settings))
+                self.set_port_settings(*settings)
             try:
                 probe_method_callable(*args, **kwargs)
                 actual_uart_settings = self.get_port_settings()
+                self._remember_uart_settings()
                 self._set_port_settings_raw(initial_uart_settings)
                 return actual_uart_settings
             except IOError:
-                logger.debug("Trying serial port settings: %s" % str(settings))
-                self.set_port_settings(*settings)
                 continue
-        else:
-            raise UARTSettingsNotFoundError(
-                "All serial port settings were not successful! Check device slaveid/power!"
-            )
+        self._set_port_settings_raw(initial_uart_settings)
+        raise UARTSettingsNotFoundError(
+            "All serial port settings were not successful! Check device slaveid/power!"
+        )
 
     def get_serial_number(self):
         """
@@ -628,26 +589,34 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         :return: serial number of device
         :rtype: int
         """
-        device_signature = str(self.get_device_signature())
-        if WBMAP_MARKER.match(device_signature):
-            logger.debug("Will calculate SN as WB-MAP*")
-            return self._get_serial_number_map()
-        else:
-            return self.read_u32_big_endian(self.COMMON_REGS_MAP["serial_number"])
+        if "serial_number" not in self._metadata_cache:
+            device_signature = str(self.get_device_signature())
+            if WBMAP_MARKER.match(device_signature):
+                logger.debug("Will calculate SN as WB-MAP*")
+                serial_number = self._get_serial_number_map()
+            else:
+                serial_number = self.read_u32_big_endian(self.COMMON_REGS_MAP["serial_number"])
+            self._metadata_cache["serial_number"] = serial_number
+        return self._metadata_cache["serial_number"]
 
     def _get_serial_number_map(self):
         int_values = self.read_u16_inputs(self.COMMON_REGS_MAP["serial_number"], 2)
         return int_values[0] * 65536 + int_values[1] - 0xFE000000
 
     def get_fw_version(self):
-        return self.read_string(self.COMMON_REGS_MAP["fw_version"], self.FIRMWARE_VERSION_LENGTH)
+        if "fw_version" not in self._metadata_cache:
+            self._metadata_cache["fw_version"] = self.read_string(
+                self.COMMON_REGS_MAP["fw_version"], self.FIRMWARE_VERSION_LENGTH
+            )
+        return self._metadata_cache["fw_version"]
 
     def get_slave_addr(self):
         return self.read_u16(self.COMMON_REGS_MAP["slaveid"])
 
     def set_slave_addr(self, addr):
         """
-        Trying to write modbus slaveid to device's reg. Checking success via initializing a new instrument with uart settings of a previous one and the new slaveid. Updating current instrument instance with set slaveid, if succeed.
+        Trying to write modbus slaveid to device's reg. Checking success via reading from the new slaveid
+        by current instrument. Keeping the new slaveid on current instrument instance, if succeed.
 
         Typical usage:
         instrument = WBModbusDeviceBase(0, <port>)
@@ -662,57 +631,44 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
             self.write_u16(reg, to_write)
         except minimalmodbus.ModbusException:
             pass
-        baudrate, parity, stopbits = (
-            self.settings.baudrate,
-            self.settings.parity,
-            self.settings.stopbits,
-        )
-        checking_device = MinimalModbusAPIWrapper(
-            to_write, self.port, baudrate, parity, stopbits, self.instrument
-        )
-        checking_device.read_u16(
-            self.COMMON_REGS_MAP["slaveid"]
-        )  # Raises minimalmodbus.ModbusException, if <to_write> was not written
-        self.device = checking_device.device  # Updating current instrument
+        previous_addr = self.device.address
+        self.device.address = to_write  # checking via current instrument; no need to init a new one
+        try:
+            self.read_u16(reg)  # Raises minimalmodbus.ModbusException, if <to_write> was not written
+        except Exception:
+            self.device.address = previous_addr
+            raise
         self.slaveid = to_write
 
     def set_baudrate(self, bd):
         """
         Writing baudrate to device and updating UART settings of current instrument to written baudrate.
+        Other UART params are rewritten with actual ones (all params are written per one message).
 
         :param bd: serial port's speed
         :type bd: int
         """
-        _validate_param(bd, ALLOWED_BAUDRATES)
-        to_write = int(bd / 100)
-        self.write_u16(self.COMMON_REGS_MAP["baudrate"], to_write)
-        serial_settings = {"baudrate": bd}
-        self._set_port_settings_raw(serial_settings)
+        self.write_uart_settings(bd, self.settings.parity, self.settings.stopbits)
 
     def set_parity(self, parity):
         """
         Writing parity to device and updating current instrument to written parity.
+        Other UART params are rewritten with actual ones (all params are written per one message).
 
         :param parity: parity of serial port
         :type parity: str
         """
-        _validate_param(parity, ALLOWED_PARITIES)
-        to_write = ALLOWED_PARITIES[parity]
-        self.write_u16(self.COMMON_REGS_MAP["parity"], to_write)
-        serial_settings = {"parity": parity}
-        self._set_port_settings_raw(serial_settings)
+        self.write_uart_settings(self.settings.baudrate, parity, self.settings.stopbits)
 
     def set_stopbits(self, stopbits):
         """
         Writing stopbits to device and updating current instrument to written stopbits.
+        Other UART params are rewritten with actual ones (all params are written per one message).
 
         :param stopbits: stopbits of serial port
         :type stopbits: int
         """
-        _validate_param(stopbits, ALLOWED_STOPBITS)
-        self.write_u16(self.COMMON_REGS_MAP["stopbits"], stopbits)
-        serial_settings = {"stopbits": stopbits}
-        self._set_port_settings_raw(serial_settings)
+        self.write_uart_settings(self.settings.baudrate, self.settings.parity, stopbits)
 
     def get_device_signature(self):
         """
@@ -721,7 +677,11 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         :return: device signature string
         :rtype: str
         """
-        return self.read_string(self.COMMON_REGS_MAP["device_signature"], self.DEVICE_SIGNATURE_LENGTH)
+        if "device_signature" not in self._metadata_cache:
+            self._metadata_cache["device_signature"] = self.read_string(
+                self.COMMON_REGS_MAP["device_signature"], self.DEVICE_SIGNATURE_LENGTH
+            )
+        return self._metadata_cache["device_signature"]
 
     def get_fw_signature(self):
         """
@@ -730,14 +690,23 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         :return: firmware signature string
         :rtype: str
         """
-        try:
-            return self.read_string(self.COMMON_REGS_MAP["fw_signature"], self.FIRMWARE_SIGNATURE_LENGTH)
-        except minimalmodbus.IllegalRequestError:
-            raise TooOldDeviceError("Device is too old and haven't fw_signature in regs!")
+        if "fw_signature" not in self._metadata_cache:
+            try:
+                self._metadata_cache["fw_signature"] = self.read_string(
+                    self.COMMON_REGS_MAP["fw_signature"], self.FIRMWARE_SIGNATURE_LENGTH
+                )
+            except minimalmodbus.IllegalRequestError:
+                raise TooOldDeviceError("Device is too old and haven't fw_signature in regs!")
+        return self._metadata_cache["fw_signature"]
+
+    def get_bootloader_version(self):
+        if "bootloader_version" not in self._metadata_cache:
+            self._metadata_cache["bootloader_version"] = self._read_bootloader_version()
+        return self._metadata_cache["bootloader_version"]
 
     @apply_serial_settings
     @force()
-    def get_bootloader_version(self):
+    def _read_bootloader_version(self):
         # Try to read full-length version string. The last char is STM type or dev bootloader sign
         try:
             version = self.device.read_string(
@@ -757,6 +726,119 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         except minimalmodbus.IllegalRequestError:
             raise TooOldDeviceError("Device is too old and haven't bootloader version in regs!")
 
+    @apply_serial_settings
+    @force()
+    def _read_holdings_block(self, beginning, number_of_regs):
+        try:
+            return self.device.read_string(beginning, number_of_regs, 3)  # raw payload as latin1 str
+        except minimalmodbus.IllegalRequestError:
+            return None  # not all regs of block are readable on device; no need to retry
+
+    def _split_common_block(self, keys):
+        """
+        Grouping keys of COMMON_REGS_MAP into consecutive regs spans (as modbus message allows),
+        merging values separated by no more than MAX_REGS_GAP_PER_READ unused regs.
+
+        :return: [(beginning, end, [keys])] sorted by address
+        :rtype: list
+        """
+        spans = []
+        for key in sorted(keys, key=self.COMMON_REGS_MAP.__getitem__):
+            beginning = self.COMMON_REGS_MAP[key]
+            end = beginning + self.COMMON_REGS_LAYOUT[key][0]
+            if (
+                spans
+                and beginning - spans[-1][1] <= self.MAX_REGS_GAP_PER_READ
+                and max(end, spans[-1][1]) - spans[-1][0] <= self.MAX_REGS_PER_READ
+            ):
+                spans[-1][1] = max(end, spans[-1][1])
+                spans[-1][2].append(key)
+            else:
+                spans.append([beginning, end, [key]])
+        return spans
+
+    def read_common_block(self, keys):
+        """
+        Reading several values from COMMON_REGS_MAP per as few modbus messages, as possible
+        (each one covers min->max span of its regs).
+
+        :param keys: keys of COMMON_REGS_MAP, described in COMMON_REGS_LAYOUT
+        :type keys: iterable
+        :return: {key: value} (raw u16/u32 values as int, strings as str)
+            or None, if device does not allow to read any of spans
+        :rtype: dict
+        """
+        ret = {}
+        spans = self._split_common_block(keys)
+        if not spans:
+            return ret
+
+        # response_timeout fits short replies; a long one takes much longer to transfer on low baudrates.
+        # Timeout is set once per block (pyserial reconfigures an open port on each set)
+        # slaveid, fcode, bytes count, payload, crc
+        longest_reply = 5 + 2 * max(end - beginning for beginning, end, _ in spans)
+        initial_response_timeout = self.device.serial.timeout
+        self.device.serial.timeout = (
+            initial_response_timeout + longest_reply * self.UART_CHAR_BITS / self.settings.baudrate
+        )
+        try:
+            for beginning, end, span_keys in spans:
+                payload = self._read_holdings_block(beginning, end - beginning)
+                if payload is None:
+                    return None
+
+                for key in span_keys:
+                    offset = (self.COMMON_REGS_MAP[key] - beginning) * 2
+                    regs_length, value_type = self.COMMON_REGS_LAYOUT[key]
+                    value_bytestr = payload[offset : offset + regs_length * 2]
+                    if value_type == "str":
+                        ret[key] = self._to_wb_str(value_bytestr)
+                    else:  # u16 or big-endian u32
+                        ret[key] = int.from_bytes(value_bytestr.encode("latin1"), "big")
+        finally:
+            self.device.serial.timeout = initial_response_timeout
+        return ret
+
+    def read_metadata_block(self):
+        """
+        Reading device_signature, fw_version, serial_number and fw_signature per as few modbus messages,
+        as possible (uptime is stored separately => one more message).
+        Falls back to separate reads, if device does not allow to read any of blocks.
+
+        :raises minimalmodbus.NoResponseError: device has not answered the first request (is disconnected)
+        :raises PartialResponseError: device has answered the first request, but has failed the following ones
+        :return: device's metadata (fw_signature is empty, if device is too old to have it)
+        :rtype: Metadata
+        """
+        # device_signature regs are far from the others => are read by a separate (first) request anyway
+        values = self.read_common_block(("device_signature",))
+        try:
+            if values is not None:
+                more_values = self.read_common_block(("fw_version", "serial_number", "fw_signature"))
+                values = None if more_values is None else dict(values, **more_values)
+            if values is None:
+                logger.debug("Could not read metadata block; will read metadata regs separately")
+                try:
+                    fw_signature = self.get_fw_signature()
+                except TooOldDeviceError:
+                    fw_signature = ""
+                return Metadata(
+                    self.get_device_signature(),
+                    self.get_fw_version(),
+                    self.get_serial_number(),
+                    fw_signature,
+                    self.get_uptime(),
+                )
+
+            if WBMAP_MARKER.match(values["device_signature"]):
+                values["serial_number"] = self._get_serial_number_map()
+            self._metadata_cache.update(values)
+            return Metadata(uptime=self.get_uptime(), **values)
+        except minimalmodbus.ModbusException as e:
+            raise PartialResponseError(
+                f"Device ({self.port} {self.slaveid}) has stopped answering while reading metadata"
+            ) from e
+
     def get_uptime(self):
         """
         Uptime is a number of seconds, gone from previous reboot of device's MCU.
@@ -784,22 +866,23 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
 
         :param bootloader_timeout: time, device is in bootloader after reboot, defaults to 3
         :type bootloader_timeout: int, optional
-        :raises RuntimeError: device's uptime after reboot is not less than before
+        :raises RuntimeError: device's uptime after reboot is longer, than time passed since reboot
         """
         to_write = 1
-        uptime_before = self.get_uptime()
+        self.clear_metadata_cache()
+        reboot_ts = time.monotonic()  # device reboots, while the write is waiting for a reply
         try:
             self.device.write_register(self.COMMON_REGS_MAP["reboot"], to_write, 0, 6, False)
         except minimalmodbus.ModbusException:
             pass  # Device has rebooted and doesn't send responce (Fixed in latest FWs)
         time.sleep(bootloader_timeout)
         uptime_after = self.get_uptime()
-        if uptime_after > uptime_before:
+        if uptime_after > time.monotonic() - reboot_ts + 1:  # uptime is in whole seconds
             raise RuntimeError("Device has not rebooted!")
 
     def _jump_to_bootloader(self):
         if self.get_port_settings() != SerialSettings(9600, "N", 2):
-            for _ in range(ALLOWED_UNSUCCESSFUL_TRIES):
+            for _ in range(wb_modbus.ALLOWED_UNSUCCESSFUL_TRIES):
                 try:
                     self.write_once_u16(
                         self.COMMON_REGS_MAP["reboot_to_bootloader_preserve_port_settings"], 1
@@ -826,13 +909,17 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         :raises RuntimeError: device has not stuck in bootloader
         """
         self.get_slave_addr()  # To ensure, device has connection
+        self.clear_metadata_cache()
         self._set_port_settings_raw(self._jump_to_bootloader())
-        time.sleep(0.5)  # Delay before going to bootloader
-        try:
-            self.get_slave_addr()
-            raise TooOldDeviceError("Device has not rebooted to bootloader!")
-        except minimalmodbus.ModbusException:
-            pass  # Device is in bootloader mode and doesn't respond
+        deadline = time.monotonic() + self.BOOTLOADER_ENTER_TIMEOUT
+        while True:
+            try:
+                self.get_slave_addr()
+            except minimalmodbus.ModbusException:
+                return  # Device is in bootloader mode and doesn't respond
+            if time.monotonic() > deadline:
+                raise TooOldDeviceError("Device has not rebooted to bootloader!")
+            time.sleep(0.05)
 
     def probe_bootloader(self, _probe_func=None):
         """
@@ -889,12 +976,14 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         except minimalmodbus.ModbusException:
             return self._has_bootloader_answered()  # Is device in bootloader or disconnected
 
+    @apply_serial_settings
+    @force()
     def _write_port_settings(self, baudrate, parity, stopbits):
         """
         bd, parity and stopbits regs are mapped consistently (110, 111, 112)
         Writing all settings per one message
         """
-        self.device.write_registers(self.COMMON_REGS_MAP["baudrate"], [int(baudrate / 100), parity, stopbits])
+        self.device.write_registers(self.COMMON_REGS_MAP["baudrate"], [baudrate // 100, parity, stopbits])
 
     def write_uart_settings(self, baudrate, parity, stopbits):
         """
@@ -907,10 +996,9 @@ class WBModbusDeviceBase(MinimalModbusAPIWrapper):
         :param stopbits: serial port stopbits
         :type stopbits: int
         """
-        for param, allowed_row in zip(
-            [baudrate, parity, stopbits], [ALLOWED_BAUDRATES, ALLOWED_PARITIES.keys(), ALLOWED_STOPBITS]
-        ):
-            _validate_param(param, allowed_row)
-        self._write_port_settings(baudrate, ALLOWED_PARITIES[parity], stopbits)
-        new_port_settings = SerialSettings(baudrate=baudrate, parity=parity, stopbits=stopbits)
+        _validate_uart_settings(baudrate, parity, stopbits)
+        new_port_settings = SerialSettings(baudrate=int(baudrate), parity=parity, stopbits=int(stopbits))
+        self._write_port_settings(
+            new_port_settings.baudrate, ALLOWED_PARITIES[parity], new_port_settings.stopbits
+        )
         self._set_port_settings_raw(new_port_settings)
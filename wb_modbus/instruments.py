@@ -1,7 +1,7 @@
 # pylint: skip-file
 import atexit
 import ipaddress
-import sys
+import select
 import termios
 import time
 from contextlib import contextmanager
@@ -20,12 +20,29 @@ class PyserialBackendInstrument(minimalmodbus.Instrument):
     _communicate is vanilla-minimalmodbus, except all foregoing_noise_cancelling cases
     """
 
+    _low_latency_ports = set()  # flag is kept by tty driver between port openings (until restored by caller)
+
     def __init__(self, *args, **kwargs):
         self.foregoing_noise_cancelling = kwargs.pop(
             "foregoing_noise_cancelling", False
         )  # Some early WB7s have hardware bug, causing additional zero byte on RX after write to port
         super(PyserialBackendInstrument, self).__init__(*args, **kwargs)
 
+    def _enable_low_latency(self):
+        """
+        USB-serial adapters hold received bytes up to latency_timer (16ms by default) before passing them up;
+        ASYNC_LOW_LATENCY makes them do it at once. Other ports do not support it (and do not need it).
+        """
+        port = self.serial.port
+        if port in self._low_latency_ports:
+            return
+        self._low_latency_ports.add(port)
+        try:
+            self.serial.set_low_latency_mode(True)
+            logger.debug("Low latency mode is enabled on %s", port)
+        except (AttributeError, ValueError, OSError) as e:
+            logger.debug("Could not enable low latency mode on %s: %s", port, e)
+
     def _get_possible_correct_response_beginnings(self, rtu_request):
         """
         We assume, that correct-response-beginning is [slaveid][fcode] or [slaveid][errcode]
@@ -43,14 +60,16 @@ class PyserialBackendInstrument(minimalmodbus.Instrument):
     def _read_from_bus(self, number_of_bytes_to_read, minimum_silent_period):
         """
         If there is foregoing noise, number_of_bytes_to_read = noise_bytes + part_of_response
-        => reading remained part_of_response per-byte
+        => reading remained part_of_response by all already received bytes at once
         """
         answer = self.serial.read(number_of_bytes_to_read)
         if self.foregoing_noise_cancelling:
             time.sleep(minimum_silent_period)
-            while self.serial.inWaiting():
-                answer += self.serial.read(1)
+            bytes_waiting = self.serial.in_waiting
+            while bytes_waiting:
+                answer += self.serial.read(bytes_waiting)
                 time.sleep(minimum_silent_period)
+                bytes_waiting = self.serial.in_waiting
         return answer
 
     def _communicate(self, request, number_of_bytes_to_read):
@@ -107,23 +126,26 @@ class PyserialBackendInstrument(minimalmodbus.Instrument):
         if self.foregoing_noise_cancelling:
             possible_response_beginnings = self._get_possible_correct_response_beginnings(request)
 
-        self._print_debug(
-            "Will write to instrument (expecting {} bytes back): {!r} ({})".format(
-                number_of_bytes_to_read, request, minimalmodbus._hexlify(request)
+        if self.debug:
+            self._print_debug(
+                "Will write to instrument (expecting {} bytes back): {!r} ({})".format(
+                    number_of_bytes_to_read, request, minimalmodbus._hexlify(request)
+                )
             )
-        )
 
         if not self.serial.is_open:
-            self._print_debug("Opening port {}".format(self.serial.port))
+            if self.debug:
+                self._print_debug("Opening port {}".format(self.serial.port))
             self.serial.open()
+        self._enable_low_latency()
 
         if self.clear_buffers_before_each_transaction:
-            self._print_debug("Clearing serial buffers for port {}".format(self.serial.port))
+            if self.debug:
+                self._print_debug("Clearing serial buffers for port {}".format(self.serial.port))
             self.serial.reset_input_buffer()
             self.serial.reset_output_buffer()
 
-        if sys.version_info[0] > 2:
-            request = bytes(request, encoding="latin1")  # Convert types to make it Python3 compatible
+        request = bytes(request, encoding="latin1")
 
         # Sleep to make sure 3.5 character times have passed
         minimum_silent_period = minimalmodbus._calculate_minimum_silent_period(self.serial.baudrate)
@@ -187,23 +209,23 @@ class PyserialBackendInstrument(minimalmodbus.Instrument):
         minimalmodbus._latest_read_times[self.serial.port] = minimalmodbus._now()
 
         if self.close_port_after_each_call:
-            self._print_debug("Closing port {}".format(self.serial.port))
+            if self.debug:
+                self._print_debug("Closing port {}".format(self.serial.port))
             self.serial.close()
 
-        if sys.version_info[0] > 2:
-            # Convert types to make it Python3 compatible
-            answer = str(answer, encoding="latin1")
+        answer = str(answer, encoding="latin1")
 
         if self.foregoing_noise_cancelling:
             for bs in possible_response_beginnings:
-                noise, sep, ret = answer.partition(bs)
-                if ret:  # There is something after possible response beginning
-                    self._print_debug(
-                        "Foregoing noise cancelling:\n\tPlain response: {}\n\tNoise: {}; Answer: {}".format(
-                            *map(lambda x: minimalmodbus._hexlify(x), (answer, noise, sep + ret))
+                pos = answer.find(bs)
+                if 0 <= pos < len(answer) - len(bs):  # There is something after possible response beginning
+                    if self.debug:
+                        template = (
+                            "Foregoing noise cancelling:\n\tPlain response: {}\n\tNoise: {}; Answer: {}"
                         )
-                    )
-                    answer = sep + ret
+                        parts = (answer, answer[:pos], answer[pos:])
+                        self._print_debug(template.format(*map(minimalmodbus._hexlify, parts)))
+                    answer = answer[pos:]
                     break
 
         if self.debug:
@@ -236,9 +258,8 @@ class StopbitsTolerantInstrument(PyserialBackendInstrument):
     def _set_stopbits_onthefly(self, stopbits):
         """
         We need to ensure, all data has gone from buffers before setting stopbits to avoid payload corruption
+        (TCSADRAIN applies new settings only after all queued output has been transmitted)
         """
-        termios.tcdrain(self.serial.fd)
-
         self.serial._stopbits = stopbits
         (iflag, oflag, cflag, lflag, ispeed, ospeed, cc) = termios.tcgetattr(self.serial.fd)
         if stopbits == 1:
@@ -247,25 +268,23 @@ class StopbitsTolerantInstrument(PyserialBackendInstrument):
             cflag |= termios.CSTOPB
         termios.tcsetattr(self.serial.fd, termios.TCSADRAIN, [iflag, oflag, cflag, lflag, ispeed, ospeed, cc])
 
-        termios.tcdrain(self.serial.fd)
-
     def _write_to_bus(self, request):
         """
         Set stopbits-to-receive after all data-to-send goes out from output buffer
         """
         self._initial_stopbits = self.serial._stopbits
         super(StopbitsTolerantInstrument, self)._write_to_bus(request)
-        write_ts = time.time()
-        while (self.serial.out_waiting > 0) or (self.serial.in_waiting == 0):
-            if time.time() - write_ts < self.serial.timeout:
-                time.sleep(0.1)
-            else:
-                if (self.serial.out_waiting == 0) and (self.serial.in_waiting == 0):
-                    raise minimalmodbus.NoResponseError("No communication with the instrument (no answer)")
-                else:
-                    raise minimalmodbus.MasterReportedException(
-                        "Output serial buffer is not empty after %.2fs (serial.timeout)" % self.serial.timeout
-                    )
+        deadline = time.monotonic() + self.serial.timeout
+        while self.serial.out_waiting > 0:  # unlike termios.tcdrain(), is bounded by serial.timeout
+            if time.monotonic() > deadline:
+                raise minimalmodbus.MasterReportedException(
+                    "Output serial buffer is not empty after %.2fs (serial.timeout)" % self.serial.timeout
+                )
+            time.sleep(0.001)  # a few chars on common baudrates
+        if not self.serial.in_waiting:
+            ready, _, _ = select.select([self.serial.fd], [], [], max(deadline - time.monotonic(), 0))
+            if not ready:
+                raise minimalmodbus.NoResponseError("No communication with the instrument (no answer)")
         self._set_stopbits_onthefly(stopbits=1)
 
     def _read_from_bus(self, number_of_bytes_to_read, minimum_silent_period):
@@ -303,8 +322,8 @@ class PySerialMock:
             logger.debug(
                 "Calling undefined %s(args: %s; kwargs: %s) on %s",
                 name,
-                str(args),
-                str(kwargs),
+                args,
+                kwargs,
                 self.__class__.__name__,
             )
             return self
@@ -327,6 +346,8 @@ class SerialRPCBackendInstrument(minimalmodbus.Instrument):
 
     _MQTT_BROKER_URL = DEFAULT_BROKER_URL
     _MQTT_CONNECTIONS = {}
+    _ATEXIT_BROKERS = set()
+    _RPC_CLIENTS = {}  # rpc client subscribes to reply topics once => reusing it per broker
 
     RPC_ERR_STATES = {"JSON_PARSE": -32700, "REQUEST_HANDLING": -32000, "REQUEST_TIMEOUT": -32100}
 
@@ -366,12 +387,17 @@ class SerialRPCBackendInstrument(minimalmodbus.Instrument):
     def mqtt_connections(self):
         return type(self)._MQTT_CONNECTIONS
 
+    @property
+    def rpc_clients(self):
+        return type(self)._RPC_CLIENTS
+
     def close_mqtt(self, broker_url):
         client = self.mqtt_connections.get(broker_url)
 
         if client:
             client.stop()
             self.mqtt_connections.pop(broker_url)
+            self.rpc_clients.pop(broker_url, None)
             logger.debug("Mqtt: close %s", broker_url)
         else:
             logger.warning("Mqtt connection %s not found in active ones!", broker_url)
@@ -388,11 +414,20 @@ class SerialRPCBackendInstrument(minimalmodbus.Instrument):
                 logger.debug("New mqtt connection: %s", broker_url)
                 client.start()
                 self.mqtt_connections.update({broker_url: client})
+                if broker_url not in self._ATEXIT_BROKERS:
+                    atexit.register(lambda: self.close_mqtt(broker_url))
+                    self._ATEXIT_BROKERS.add(broker_url)
                 yield client
             except (rpcclient.TimeoutError, OSError) as e:
                 raise RPCConnectionError from e
-            finally:
-                atexit.register(lambda: self.close_mqtt(broker_url))
+
+    def get_rpc_client(self, mqtt_client):
+        rpc_client = self.rpc_clients.get(self.broker_url)
+        if rpc_client is None:
+            rpc_client = rpcclient.TMQTTRPCClient(mqtt_client)
+            mqtt_client.on_message = rpc_client.on_mqtt_message
+            self.rpc_clients[self.broker_url] = rpc_client
+        return rpc_client
 
     def get_transport_params(self):
         return {
@@ -412,7 +447,7 @@ class SerialRPCBackendInstrument(minimalmodbus.Instrument):
         rpc_request = {
             "response_size": number_of_bytes_to_read,
             "format": "HEX",
-            "msg": minimalmodbus._hexencode(request),
+            "msg": request.encode("latin1").hex().upper(),  # same as minimalmodbus._hexencode, but in C
             "response_timeout": round(max(self.serial.timeout, min_response_timeout) * 1e3),
         }
         rpc_request.update(self.get_transport_params())
@@ -420,8 +455,7 @@ class SerialRPCBackendInstrument(minimalmodbus.Instrument):
         with self.get_mqtt_client(self.broker_url) as mqtt_client:
             rpc_call_timeout = 10
             try:
-                rpc_client = rpcclient.TMQTTRPCClient(mqtt_client)
-                mqtt_client.on_message = rpc_client.on_mqtt_message
+                rpc_client = self.get_rpc_client(mqtt_client)
                 logger.debug("RPC Client -> %s (rpc timeout: %ds)", rpc_request, rpc_call_timeout)
                 response = rpc_client.call("wb-mqtt-serial", "port", "Load", rpc_request, rpc_call_timeout)
                 logger.debug("RPC Client <- %s", response)
@@ -433,7 +467,7 @@ class SerialRPCBackendInstrument(minimalmodbus.Instrument):
                 )
                 raise reraise_err from e
             else:
-                return minimalmodbus._hexdecode(str(response.get("response", "")))
+                return minimalmodbus._hexdecode(response.get("response") or "")
 
 
 class TCPRPCBackendInstrument(SerialRPCBackendInstrument):